@@ -1,36 +1,89 @@
 import asyncio
+import json
 import logging
+import os
+import random
+import re
+import tempfile
 import time
 
+from collections import OrderedDict
+from datetime import datetime
+from functools import lru_cache
 from typing import Generator, Tuple
 
-import dateutil.parser
+import aiohttp
+import orjson
 from disnake import Embed, Colour
 
 logger = logging.getLogger(__name__)
 
+# template comment lines (e.g. "<!-- Describe your change -->") and surrounding whitespace on each line
+_template_comment_re = re.compile(r'^<!-[^\n]*(?:\n|$)', re.MULTILINE)
+_line_whitespace_re = re.compile(r'^[ \t]+|[ \t]+$', re.MULTILINE)
+
+
+# the same timestamps show up repeatedly across related webhook events, datetimes are immutable so caching is safe
+@lru_cache(maxsize=2048)
+def _parse_ts(timestamp: str) -> datetime:
+    # GitHub timestamps are always ISO 8601, but fromisoformat() only accepts 'Z' on Python 3.11+
+    return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+
+
+def _strip_template_comments(body: str) -> str:
+    body = body.replace('\r\n', '\n')
+    # most bodies don't use a template at all
+    if '<!-' in body:
+        body = _template_comment_re.sub('', body)
+    return _line_whitespace_re.sub('', body).strip()
+
 
 class GitHubHelper:
     """Helper for processing github webhooks and API stuff"""
 
-    _commit_colour = 0xFFFFFF
-    _skipped_commit_colour = 0x9B9B9B
-    _pull_request_colour = 0x366D6
-    _issue_colour = 0x2CBE4E
-    _discussion_colour = 0x9A66EE
-    _ci_failed_colour = 0xD0021B
-    _ci_some_failed_colour = 0xF5A623
-    _ci_passed_colour = 0x7ED321
-    _wiki_colour = 0xF8C8DC
+    _commit_colour = Colour(0xFFFFFF)
+    _skipped_commit_colour = Colour(0x9B9B9B)
+    _pull_request_colour = Colour(0x366D6)
+    _issue_colour = Colour(0x2CBE4E)
+    _discussion_colour = Colour(0x9A66EE)
+    _ci_failed_colour = Colour(0xD0021B)
+    _ci_some_failed_colour = Colour(0xF5A623)
+    _ci_passed_colour = Colour(0x7ED321)
+    _wiki_colour = Colour(0xF8C8DC)
 
     def __init__(self, session, config, state):
         self.session = session
         self.config = config
         self.state = state
+        # the session is shared with other cogs, so the token is only added to our own requests
+        self._auth_headers = {'Authorization': config['github_api_auth']}
 
         # internal user cache, gets invalidated on refreshes
         self.user_cache = dict()
         self.user_cache_max_age = 3600 * 24 * 7
+        # users that do not exist (anymore) are cached for a shorter time
+        self.user_cache_not_found_max_age = 3600
+        # lookups currently in progress, so concurrent callers share a single request
+        self._inflight = dict()
+        # optionally persist user cache to disk so restarts don't refetch everyone
+        self._user_cache_file = config.get('user_cache_file', None)
+        self._user_cache_dirty = False
+        self.load_user_cache()
+        # check suite id -> workflow run id, saves listing all runs for known suites
+        self._suite_to_run = OrderedDict()
+        self._suite_to_run_max_size = 128
+        # short-lived copy of the last workflow runs list, plus jobs of already completed runs
+        self._runs_cache = (0, None)
+        self._runs_cache_max_age = 20
+        self._jobs_cache = OrderedDict()
+        self._jobs_cache_max_size = 64
+        # API rate limit info from the last response, used to pause before we actually run out
+        self._rl_remaining = None
+        self._rl_reset = 0
+        self._rl_threshold = 10
+        self._rl_lock = asyncio.Lock()
+        # upper bound for how long a single request waits on a rate limit before retrying
+        self._rate_limit_max_delay = 300.0
 
     async def get_commit_messages(self, event_body, brief=False):
         embed_commits = []
@@ -44,26 +97,57 @@ class GitHubHelper:
             compare_url = f'https://github.com/{project}/compare/{first_hash}^...{last_hash}'
             embed = Embed(
                 title=f'Skipped {len(commits) - 1} commits... (click link for diff)',
-                colour=Colour(self._skipped_commit_colour),
+                colour=self._skipped_commit_colour,
                 url=compare_url,
             )
             embed_commits.append((embed, None))
             commits = commits[-1:]
 
+        # fetch all unique authors concurrently rather than one request per commit
+        fetch_start = time.time()
+        usernames = list({c['author'].get('username', None) for c in commits} - {None})
+        authors = await asyncio.gather(*(self.get_author_info(u) for u in usernames), return_exceptions=True)
+        # a failed lookup just means we fall back to the commit's author name
+        user_map = {u: None if isinstance(a, BaseException) else a for u, a in zip(usernames, authors)}
+
+        # a different git author name than the one we know suggests the cached profile is outdated, refetch those once
+        commit_names = {c['author'].get('username', None): c['author'].get('name', None) for c in commits}
+        stale = []
+        for username, author in user_map.items():
+            commit_name = commit_names[username]
+            if not author or not commit_name or commit_name in {author['name'], author.get('_commit_name', None)}:
+                continue
+            if author.get('_timestamp', 0) >= fetch_start:
+                # just fetched, so this is as fresh as it gets
+                author['_commit_name'] = commit_name
+                self._user_cache_dirty = True
+            else:
+                stale.append(username)
+
+        refreshed = await asyncio.gather(*(self.get_author_info(u, force=True) for u in stale), return_exceptions=True)
+        for username, author in zip(stale, refreshed):
+            if isinstance(author, BaseException):
+                # keep the stale data we already have
+                continue
+            # only remember the name if the refetch worked, otherwise we keep using the stale data this time
+            if author and author.get('_timestamp', 0) >= fetch_start:
+                # remember the name so commits by this author don't trigger a refetch every time
+                author['_commit_name'] = commit_names[username]
+                self._user_cache_dirty = True
+            user_map[username] = author
+
         for commit in commits:
             author_username = commit['author'].get('username', None)
             author_name = commit['author'].get('name', None)
-            timestamp = dateutil.parser.parse(commit['timestamp'])
+            timestamp = _parse_ts(commit['timestamp'])
             commit_message = commit['message'].split('\n')
-            embed = Embed(
-                title=commit_message[0], colour=Colour(self._commit_colour), url=commit['url'], timestamp=timestamp
-            )
+            embed = Embed(title=commit_message[0], colour=self._commit_colour, url=commit['url'], timestamp=timestamp)
 
             if len(commit_message) > 2 and not brief:
                 commit_body = '\n'.join(commit_message[2:])
                 embed.description = commit_body[:4096]
 
-            author = await self.get_author_info(author_username)
+            author = user_map.get(author_username, None)
 
             if author:
                 if author['name'] and author['name'] != author['login']:
@@ -108,34 +192,34 @@ class GitHubHelper:
     async def get_pr_messages(self, event_body):
         pr_number = event_body['number']
         title = event_body['pull_request']['title']
-        timestamp = dateutil.parser.parse(event_body['pull_request']['created_at'])
-        embed = Embed(
+        timestamp = _parse_ts(event_body['pull_request']['created_at'])
+        # build separate embeds for the brief and full channels rather than copying one
+        embed_args = dict(
             title=f'#{pr_number}: {title}',
-            colour=Colour(self._pull_request_colour),
+            colour=self._pull_request_colour,
             url=event_body['pull_request']['html_url'],
             timestamp=timestamp,
         )
+        brief_embed, embed = Embed(**embed_args), Embed(**embed_args)
 
         author_name = event_body['pull_request']['user']['login']
         author = await self.get_author_info(author_name)
         if author and author['name'] and author['name'] != author['login']:
             author_name = f'{author["name"]} ({author["login"]})'
 
-        embed.set_author(
-            name=author_name,
-            url=event_body['pull_request']['user']['html_url'],
-            icon_url=event_body['pull_request']['user']['avatar_url'],
-        )
-        embed.set_footer(text='Pull Request')
-        # create copy without pr body for brief channel
-        brief_embed = embed.copy()
+        for e in (brief_embed, embed):
+            e.set_author(
+                name=author_name,
+                url=event_body['pull_request']['user']['html_url'],
+                icon_url=event_body['pull_request']['user']['avatar_url'],
+            )
+            e.set_footer(text='Pull Request')
+        # brief embed does not get the pr body
         brief_embed.add_field(name='Repository', value=event_body['repository']['full_name'], inline=True)
 
         if event_body['pull_request']['body']:
             # filter out comments in template
-            pr_body = '\n'.join(
-                l.strip() for l in event_body['pull_request']['body'].splitlines() if not l.startswith('<!-')
-            )
+            pr_body = _strip_template_comments(event_body['pull_request']['body'])
             for name, value in self._format_embed(pr_body):
                 if name:
                     embed.add_field(name=name, value=value, inline=False)
@@ -149,34 +233,33 @@ class GitHubHelper:
     async def get_issue_messages(self, event_body):
         issue_number = event_body['issue']['number']
         title = event_body['issue']['title']
-        timestamp = dateutil.parser.parse(event_body['issue']['created_at'])
-        embed = Embed(
+        timestamp = _parse_ts(event_body['issue']['created_at'])
+        embed_args = dict(
             title=f'#{issue_number}: {title}',
-            colour=Colour(self._issue_colour),
+            colour=self._issue_colour,
             url=event_body['issue']['html_url'],
             timestamp=timestamp,
         )
+        brief_embed, embed = Embed(**embed_args), Embed(**embed_args)
 
         author_name = event_body['issue']['user']['login']
         author = await self.get_author_info(author_name)
         if author and author['name'] and author['name'] != author['login']:
             author_name = f'{author["name"]} ({author["login"]})'
 
-        embed.set_author(
-            name=author_name,
-            url=event_body['issue']['user']['html_url'],
-            icon_url=event_body['issue']['user']['avatar_url'],
-        )
-        embed.set_footer(text='Issue')
-        # create copy without description text for brief channel
-        brief_embed = embed.copy()
+        for e in (brief_embed, embed):
+            e.set_author(
+                name=author_name,
+                url=event_body['issue']['user']['html_url'],
+                icon_url=event_body['issue']['user']['avatar_url'],
+            )
+            e.set_footer(text='Issue')
+        # brief embed does not get the description text
         brief_embed.add_field(name='Repository', value=event_body['repository']['full_name'], inline=True)
 
         if event_body['issue']['body']:
             # filter out comments
-            issue_body = '\n'.join(
-                l.strip() for l in event_body['issue']['body'].splitlines() if not l.startswith('<!-')
-            )
+            issue_body = _strip_template_comments(event_body['issue']['body'])
 
             for name, value in self._format_embed(issue_body):
                 if name:
@@ -192,32 +275,31 @@ class GitHubHelper:
         discussion_number = event_body['discussion']['number']
         title = event_body['discussion']['title']
         category = event_body['discussion']['category']['name']
-        timestamp = dateutil.parser.parse(event_body['discussion']['created_at'])
-        embed = Embed(
+        timestamp = _parse_ts(event_body['discussion']['created_at'])
+        embed_args = dict(
             title=f'#{discussion_number}: {category} - {title}',
-            colour=Colour(self._discussion_colour),
+            colour=self._discussion_colour,
             timestamp=timestamp,
             url=event_body['discussion']['html_url'],
         )
+        brief_embed, embed = Embed(**embed_args), Embed(**embed_args)
 
         author_name = event_body['discussion']['user']['login']
         author = await self.get_author_info(author_name)
         if author and author['name'] and author['name'] != author['login']:
             author_name = f'{author["name"]} ({author["login"]})'
 
-        embed.set_author(
-            name=author_name,
-            url=event_body['discussion']['user']['html_url'],
-            icon_url=event_body['discussion']['user']['avatar_url'],
-        )
+        # brief embed does not get the description text
+        for e in (brief_embed, embed):
+            e.set_author(
+                name=author_name,
+                url=event_body['discussion']['user']['html_url'],
+                icon_url=event_body['discussion']['user']['avatar_url'],
+            )
+            e.set_footer(text='Discussion')
+            e.add_field(name='Repository', value=event_body['repository']['full_name'], inline=True)
 
-        embed.set_footer(text='Discussion')
-        embed.add_field(name='Repository', value=event_body['repository']['full_name'], inline=True)
-        # create copy without description text for brief channel
-        brief_embed = embed.copy()
-        event_body['discussion']['body'] = '\n'.join(
-            l.strip() for l in event_body['discussion']['body'].splitlines() if not l.startswith('<!-')
-        )
+        event_body['discussion']['body'] = _strip_template_comments(event_body['discussion']['body'] or '')
 
         if len(event_body['discussion']['body']) >= 1024:
             embed.description = event_body['discussion']['body'][:1024] + ' [... message trimmed]'
@@ -227,7 +309,7 @@ class GitHubHelper:
         return brief_embed, embed
 
     async def get_wiki_message(self, event_body):
-        embed = Embed(colour=Colour(self._wiki_colour))
+        embed = Embed(colour=self._wiki_colour)
         embed.set_footer(text='GitHub Wiki Changes')
         # All edits in the response are from a single author
         author_name = event_body['sender']['login']
@@ -247,6 +329,28 @@ class GitHubHelper:
         embed.description = '\n'.join(body)
         return embed
 
+    @staticmethod
+    def _find_run(runs, check_suite_id):
+        for run in runs['workflow_runs']:
+            if run['check_suite_id'] == check_suite_id:
+                return run
+        return None
+
+    async def _get_run_jobs(self, run):
+        # jobs of a finished attempt won't change anymore, re-runs keep the run id but bump the attempt
+        key = (run['id'], run.get('run_attempt', 1))
+        if (jobs := self._jobs_cache.get(key, None)) is not None:
+            self._jobs_cache.move_to_end(key)
+            return jobs
+
+        if not (jobs := await self.get_with_retry(run['jobs_url'])):
+            return None
+
+        self._jobs_cache[key] = jobs['jobs']
+        if len(self._jobs_cache) > self._jobs_cache_max_size:
+            self._jobs_cache.popitem(last=False)
+        return jobs['jobs']
+
     async def get_ci_results(self, event_body):
         check_suite_id = event_body['check_suite']['id']
         # todo allow for different workflows per repo
@@ -254,7 +358,22 @@ class GitHubHelper:
         # because the github API might not be updated by the time we get the webhook, we 'd want to retry
         # this request a few times before giving up (did I mention the API related to actions is "great"? *sigh*)
         run = None
+        if run_id := self._suite_to_run.get(check_suite_id, None):
+            self._suite_to_run.move_to_end(check_suite_id)
+            _run = await self.get_with_retry(
+                f'https://api.github.com/repos/obsproject/obs-studio/actions/runs/{run_id}'
+            )
+            if _run and _run['check_suite_id'] == check_suite_id:
+                run = _run
+
+        # several events for the same suite tend to arrive at once, so a very recent runs list is good enough
+        if not run and (time.time() - self._runs_cache[0]) < self._runs_cache_max_age:
+            run = self._find_run(self._runs_cache[1], check_suite_id)
+
         for _try in range(1, 6):
+            if run:
+                break
+
             runs = await self.get_with_retry(
                 f'https://api.github.com/repos/obsproject/obs-studio/'
                 f'actions/workflows/{self.config["workflow_id"]}/runs',
@@ -266,23 +385,25 @@ class GitHubHelper:
                 return None
 
             if runs:
-                for _run in runs['workflow_runs']:
-                    if _run['check_suite_id'] == check_suite_id:
-                        run = _run
-                        break
+                self._runs_cache = (time.time(), runs)
+                run = self._find_run(runs, check_suite_id)
             if run:
                 break
             # exponential backoff for subsequent tries
-            logger.warning(f'Check suite ID wasn\'t in workflow results, retrying in {2**_try} seconds...')
+            logger.warning('Check suite ID wasn\'t in workflow results, retrying in %d seconds...', 2**_try)
             await asyncio.sleep(2.0**_try)
         else:
             logger.error('Could not find check suite id in workflow runs after 5 retries.')
             return None
 
+        self._suite_to_run[check_suite_id] = run['id']
+        if len(self._suite_to_run) > self._suite_to_run_max_size:
+            self._suite_to_run.popitem(last=False)
+
         # get some useful metadata from run information
         commit_hash = run['head_sha']
-        finished = dateutil.parser.parse(run['updated_at'])
-        started = dateutil.parser.parse(run['created_at'])
+        finished = _parse_ts(run['updated_at'])
+        started = _parse_ts(run['created_at'])
         delta = (finished - started).seconds
         seconds = delta % 60
         minutes = delta // 60
@@ -290,40 +411,46 @@ class GitHubHelper:
         branch = run['head_branch']
         web_url = run['html_url']
 
-        jobs = await self.get_with_retry(run['jobs_url'])
-        if not jobs:
+        # jobs and artifacts only depend on the run, so fetch them at the same time
+        jobs, artifacts = await asyncio.gather(self._get_run_jobs(run), self.get_with_retry(run['artifacts_url']))
+        if jobs is None:
             logger.error('Getting GitHub workflow run jobs failed.')
             return None
-        jobs = jobs['jobs']
+
+        # sort jobs by conclusion in a single pass
+        succeeded, skipped, failed = [], [], []
+        # anything that isn't a success or skip counts as failed
+        buckets = {'success': succeeded, 'skipped': skipped}
+        for job in jobs:
+            buckets.get(job['conclusion'], failed).append(job['name'])
 
         total_jobs = len(jobs)
-        failed = sum(i['conclusion'] not in {'success', 'skipped'} for i in jobs)
-        build_success = failed == 0
+        failed_jobs = len(failed)
+        build_success = failed_jobs == 0
 
-        if failed == 0:
+        if failed_jobs == 0:
             colour = self._ci_passed_colour
             reaction_emote = self.config['emotes']['passed']
             build_result = 'succeeded'
             message = [f'All jobs succeeded after {minutes}m{seconds}s']
-        elif failed < total_jobs:
+        elif failed_jobs < total_jobs:
             colour = self._ci_some_failed_colour
             reaction_emote = self.config['emotes']['partial']
             build_result = 'partially failed'
-            message = [f'{failed} out of {total_jobs} jobs failed after {minutes}m{seconds}s']
+            message = [f'{failed_jobs} out of {total_jobs} jobs failed after {minutes}m{seconds}s']
         else:
             colour = self._ci_failed_colour
             reaction_emote = self.config['emotes']['failed']
             build_result = 'failed'
             message = [f'All jobs failed after {minutes}m{seconds}s']
 
-        if succeeded := [job['name'] for job in jobs if job['conclusion'] == 'success']:
-            message.append('**Succeeded:** {}'.format(', '.join(succeeded)))
-        if skipped := [job['name'] for job in jobs if job['conclusion'] == 'skipped']:
-            message.append('**Skipped:** {}'.format(', '.join(skipped)))
-        if failed := [job['name'] for job in jobs if job['conclusion'] not in {'success', 'skipped'}]:
-            message.append('**Failed:** {}'.format(', '.join(failed)))
+        if succeeded:
+            message.append(f'**Succeeded:** {", ".join(succeeded)}')
+        if skipped:
+            message.append(f'**Skipped:** {", ".join(skipped)}')
+        if failed:
+            message.append(f'**Failed:** {", ".join(failed)}')
 
-        artifacts = await self.get_with_retry(run['artifacts_url'])
         if not artifacts:
             logger.error('Getting GitHub workflow run artifacts failed.')
             return None
@@ -362,41 +489,177 @@ class GitHubHelper:
 
         return build_success, embed, (commit_hash, message[0], reaction_emote, web_url)
 
-    async def get_with_retry(self, url, params=None, retries=5, retry_interval=5.0):
+    def _get_retry_delay(self, error, attempt, retry_interval):
+        # honour GitHub's rate limit headers, but only if we were actually rate limited (403 is also used for
+        # missing permissions), and don't wait around for too long either way
+        if isinstance(error, aiohttp.ClientResponseError) and error.status in {403, 429} and error.headers:
+            delay = None
+            if retry_after := error.headers.get('Retry-After', None):
+                # secondary rate limit
+                delay = float(retry_after)
+            elif error.headers.get('X-RateLimit-Remaining', None) == '0':
+                delay = float(error.headers.get('X-RateLimit-Reset', 0)) - time.time()
+
+            if delay is not None:
+                return min(max(0.0, delay), self._rate_limit_max_delay)
+        # otherwise use exponential backoff with some jitter
+        return min(retry_interval * 2**attempt, 60.0) + random.uniform(0, 1)
+
+    def _update_rate_limit(self, headers):
+        if 'X-RateLimit-Remaining' not in headers:
+            return
+        try:
+            self._rl_remaining = int(headers['X-RateLimit-Remaining'])
+            self._rl_reset = float(headers.get('X-RateLimit-Reset', 0))
+        except ValueError:
+            pass
+
+    def _rate_limit_low(self):
+        if self._rl_remaining is None or self._rl_remaining >= self._rl_threshold:
+            return False
+        return self._rl_reset > time.time()
+
+    async def _wait_for_rate_limit(self):
+        # only one task needs to do the waiting, everyone else just queues up behind it
+        async with self._rl_lock:
+            if not self._rate_limit_low():
+                return
+            delay = min(self._rl_reset - time.time(), self._rate_limit_max_delay)
+            logger.warning('GitHub API rate limit almost exhausted, waiting %.0f seconds', delay)
+            await asyncio.sleep(delay)
+            self._rl_remaining = None
+
+    async def get_with_retry(self, url, params=None, retries=5, retry_interval=1.0):
         for i in range(retries):
+            await self._wait_for_rate_limit()
             try:
-                async with self.session.get(
-                    url, params=params, headers=dict(Authorization=self.config['github_api_auth'])
-                ) as r:
+                async with self.session.get(url, params=params, headers=self._auth_headers) as r:
+                    self._update_rate_limit(r.headers)
                     r.raise_for_status()
-                    return await r.json()
-            except Exception as e:
-                logger.warning(f'Github API request failed with {repr(e)}, retrying in {retry_interval} seconds')
-                await asyncio.sleep(retry_interval)
+                    # workflow runs/jobs responses are fairly large, orjson is a lot faster at parsing them
+                    return orjson.loads(await r.read())
+            except (aiohttp.ClientError, asyncio.TimeoutError, orjson.JSONDecodeError) as e:
+                delay = self._get_retry_delay(e, i, retry_interval)
+                logger.warning('Github API request failed with %r, retrying in %.1f seconds', e, delay)
+                await asyncio.sleep(delay)
 
         logger.error('Retries exhausted!')
         return None
 
-    async def get_author_info(self, username):
+    def invalidate_user(self, username):
+        if self.user_cache.pop(username, None):
+            self._user_cache_dirty = True
+
+    def load_user_cache(self):
+        if not self._user_cache_file or not os.path.exists(self._user_cache_file):
+            return
+
+        # drop expired entries so the file doesn't keep growing
+        now = time.time()
+        user_cache = dict()
+        try:
+            for username, data in json.load(open(self._user_cache_file)).items():
+                max_age = self.user_cache_not_found_max_age if data.get('_not_found') else self.user_cache_max_age
+                if now - data.get('_timestamp', 0) <= max_age:
+                    user_cache[username] = data
+        except Exception as e:
+            # a broken cache file shouldn't take the webhooks down with it, just start over
+            logger.warning('Loading user cache failed with %r', e)
+            return
+
+        self.user_cache.update(user_cache)
+
+        logger.info('Loaded %d cached GitHub users', len(self.user_cache))
+
+    def save_user_cache(self):
+        if not self._user_cache_file or not self._user_cache_dirty:
+            return
+
+        # write to a temporary file first so a crash can't leave us with a half-written cache
+        dirname = os.path.dirname(os.path.abspath(self._user_cache_file))
+        tmp_name = None
+        try:
+            fd, tmp_name = tempfile.mkstemp(dir=dirname, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(self.user_cache, f)
+            os.replace(tmp_name, self._user_cache_file)
+        except Exception as e:
+            logger.warning('Saving user cache failed with %r', e)
+            if tmp_name and os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+        else:
+            self._user_cache_dirty = False
+
+    async def user_cache_flusher(self, interval=60.0):
+        while True:
+            await asyncio.sleep(interval)
+            self.save_user_cache()
+
+    async def get_author_info(self, username, force=False):
         if not username:
             return None
 
-        if username in self.user_cache:
-            # check if data is stale, if not try refetching
-            if (time.time() - self.user_cache[username].get('_timestamp', 0)) > self.user_cache_max_age:
-                return self.user_cache[username]
+        if not force and username in self.user_cache:
+            cached = self.user_cache[username]
+            age = time.time() - cached.get('_timestamp', 0)
+            if cached.get('_not_found', False):
+                if age <= self.user_cache_not_found_max_age:
+                    return None
+            elif age <= self.user_cache_max_age:
+                return cached
+
+        # if someone is already fetching this user, just wait for their result
+        # shielded so a cancelled waiter doesn't cancel the shared future for everyone else
+        if username in self._inflight:
+            return await asyncio.shield(self._inflight[username])
+
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[username] = fut
+        try:
+            author = await self._fetch_author_info(username)
+        except BaseException:
+            # don't pass our own cancellation on to everyone else waiting for this user
+            if not fut.done():
+                fut.set_result(self._get_stale_author(username))
+            raise
+        else:
+            if not fut.done():
+                fut.set_result(author)
+        finally:
+            del self._inflight[username]
+
+        return author
+
+    def _get_stale_author(self, username):
+        cached = self.user_cache.get(username, None)
+        if cached and cached.get('_not_found', False):
+            return None
+        return cached
+
+    async def _fetch_author_info(self, username):
+        # user info is only cosmetic, so rather than blocking the webhook make do with what we have
+        if self._rate_limit_low():
+            return self._get_stale_author(username)
 
         try:
             async with self.session.get(
-                f'https://api.github.com/users/{username}', headers={'Authorization': self.config['github_api_auth']}
+                f'https://api.github.com/users/{username}',
+                headers=self._auth_headers,
             ) as r:
+                self._update_rate_limit(r.headers)
+                if r.status == 404:
+                    # remember missing users so we don't keep asking for them
+                    self.user_cache[username] = {'_timestamp': time.time(), '_not_found': True}
+                    self._user_cache_dirty = True
+                    return None
                 r.raise_for_status()
                 author = await r.json()
                 self.user_cache[username] = author
                 self.user_cache[username]['_timestamp'] = time.time()
+                self._user_cache_dirty = True
         except Exception as e:
-            logger.warning(f'Fetching github userdata failed with {repr(e)}')
+            logger.warning('Fetching github userdata failed with %r', e)
             # return potentially stale data if request fails
-            return self.user_cache.get(username, None)
+            return self._get_stale_author(username)
 
         return self.user_cache[username]
@@ -18,6 +18,7 @@ class Webhooks(Cog):
         self.bot = bot
         self.config = config
         self.server = None
+        self.flusher = None
 
         self.commits_channel = None
         self.brief_channel = None
@@ -118,6 +119,9 @@ class Webhooks(Cog):
                 brief, full = await self.gh_helper.get_discussion_messages(body)
                 await self.brief_channel.send(embed=brief)
                 await self.commits_channel.send(embed=full)
+        elif event == 'member':
+            # collaborator changes might come with profile changes, so drop whatever we have cached
+            self.gh_helper.invalidate_user(body['member']['login'])
         elif event == 'gollum':  # Wiki updates are "gollum" for some reason.
             embed = await self.gh_helper.get_wiki_message(body)
             await self.wiki_channel.send(embed=embed)
@@ -170,6 +174,9 @@ class Webhooks(Cog):
     def cog_unload(self):
         if self.server:
             asyncio.create_task(self.server.stop())
+        if self.flusher:
+            self.flusher.cancel()
+        self.gh_helper.save_user_cache()
 
 
 def setup(bot):
@@ -178,3 +185,4 @@ def setup(bot):
         wh = Webhooks(bot, bot.config['webhooks'])
         bot.add_cog(wh)
         bot.loop.create_task(wh.http_server())
+        wh.flusher = bot.loop.create_task(wh.gh_helper.user_cache_flusher())